@@ -0,0 +1,28 @@
+import contextlib
+import functools
+import os
+
+import libftd3xx as ftd3xx
+
+if os.environ.get("FTD3XX_WAIT_FOR_DEBUGGER"):
+    input(f"OS PID: {os.getpid()}")
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_once():
+    # Re-enumerating the USB bus is slow, so test classes share the result.
+    # Devices plugged in or removed mid-run are not picked up; anything that
+    # makes the device re-enumerate (port reset/cycle) must call
+    # _enumerate_once.cache_clear() afterwards.
+    return ftd3xx.create_device_info_list()
+
+
+@contextlib.contextmanager
+def opened_device(index=0):
+    # Close the handle even when the test fails, otherwise the device stays
+    # claimed and every later open fails.
+    handle = ftd3xx.create_by_index(index)
+    try:
+        yield handle
+    finally:
+        ftd3xx.close(handle)
@@ -1,17 +1,29 @@
 import unittest
 import libftd3xx as ftd3xx
 
+try:
+    from .helpers import _enumerate_once
+except ImportError:
+    from helpers import _enumerate_once
+
 class DeviceInfoTestCase(unittest.TestCase):
-    def setUp(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls.device_count = _enumerate_once()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.device_count
 
     def test_create_device_info_list(self):
         _ = ftd3xx.create_device_info_list()
 
     def test_get_device_info_list(self):
-        device_count = ftd3xx.create_device_info_list()
-        device_info = ftd3xx.get_device_info_list(device_count)
-        self.assertEqual(device_count, len(device_info))
+        if self.device_count == 0:
+            self.assertEqual([], ftd3xx.get_device_info_list(0))
+            return
+        device_info = ftd3xx.get_device_info_list(self.device_count)
+        self.assertEqual(self.device_count, len(device_info))
 
 
 if __name__ == '__main__':
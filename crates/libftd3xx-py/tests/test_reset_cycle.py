@@ -1,31 +1,32 @@
 import unittest
 import libftd3xx as ftd3xx
 
-# import os
-# input(f"OS PID: {os.getpid()}")
+try:
+    from .helpers import _enumerate_once, opened_device
+except ImportError:
+    from helpers import _enumerate_once, opened_device
 
 
 class ChipConfigurationTestCase(unittest.TestCase):
     def setUp(self):
-        pass
+        self.device_count = _enumerate_once()
+
+    def tearDown(self):
+        # Resetting or cycling the port makes the device re-enumerate, so
+        # later tests must not reuse the cached device count.
+        _enumerate_once.cache_clear()
 
     def test_reset_device_port(self):
-        device_count = ftd3xx.create_device_info_list()
-        if device_count > 0:
-            # device_info = ftd3xx.get_device_info_list(device_count)
-            # handle = ftd3xx.create_by_serial_number(device_info[0].SerialNumber)
-            handle = ftd3xx.create_by_index(0)
+        if self.device_count == 0:
+            self.skipTest("no FT60x device connected")
+        with opened_device() as handle:
             ftd3xx.reset_device_port(handle)
-            ftd3xx.close(handle)
 
     def test_cycle_device_port(self):
-        device_count = ftd3xx.create_device_info_list()
-        if device_count > 0:
-            # device_info = ftd3xx.get_device_info_list(device_count)
-            # handle = ftd3xx.create_by_serial_number(device_info[0].SerialNumber)
-            handle = ftd3xx.create_by_index(0)
+        if self.device_count == 0:
+            self.skipTest("no FT60x device connected")
+        with opened_device() as handle:
             ftd3xx.cycle_device_port(handle)
-            ftd3xx.close(handle)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,17 @@
 import unittest
 import libftd3xx as ftd3xx
 
-# import os
-# input(f"OS PID: {os.getpid()}")
+try:
+    from .helpers import _enumerate_once
+except ImportError:
+    from helpers import _enumerate_once
+
+# Read once at import; a driver failure is reported by test_get_library_version
+# rather than breaking the import of the whole module.
+try:
+    LIBRARY_VERSION, LIBRARY_VERSION_ERROR = ftd3xx.get_library_version(), None
+except ftd3xx.FtException as e:
+    LIBRARY_VERSION, LIBRARY_VERSION_ERROR = None, e
 
 
 class LibraryVersionTestCase(unittest.TestCase):
@@ -10,24 +19,35 @@ class LibraryVersionTestCase(unittest.TestCase):
         pass
 
     def test_get_library_version(self):
-        _ = ftd3xx.get_library_version()
+        if LIBRARY_VERSION_ERROR is not None:
+            self.fail(f"get_library_version() raised {LIBRARY_VERSION_ERROR!r}")
+        version = (LIBRARY_VERSION.major, LIBRARY_VERSION.minor, LIBRARY_VERSION.build)
+        self.assertNotEqual((0, 0, 0), version)
+        self.assertEqual("{}.{}.{}".format(*version), str(LIBRARY_VERSION))
 
 
 class DriverVersionTestCase(unittest.TestCase):
-    def setUp(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls.device_count = _enumerate_once()
+        cls.handle = None
+        if cls.device_count > 0:
+            cls.handle = ftd3xx.create_by_index(0)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.handle is not None:
+            ftd3xx.close(cls.handle)
+        del cls.device_count, cls.handle
 
     def test_get_driver_version(self):
-        self.assertRaises(TypeError, ftd3xx.get_driver_version, (None,))
-
-        device_count = ftd3xx.create_device_info_list()
-        if device_count > 0:
-            # device_info = ftd3xx.get_device_info_list(device_count)
-            # handle = ftd3xx.create_by_serial_number(device_info[0].SerialNumber)
-            handle = ftd3xx.create_by_index(0)
-            _ = ftd3xx.get_driver_version(handle)
-            #print(f"Driver Version: {_}")
-            ftd3xx.close(handle)
+        with self.assertRaises(TypeError):
+            ftd3xx.get_driver_version(None)
+
+        if self.handle is None:
+            self.skipTest("no FT60x device connected")
+        _ = ftd3xx.get_driver_version(self.handle)
+        #print(f"Driver Version: {_}")
 
 
 if __name__ == '__main__':